@@ -1,8 +1,10 @@
 import logging
 import math
+import os
+import queue
 import threading
 from datetime import datetime
-from typing import Tuple, Union
+from typing import NamedTuple, Tuple, Union
 
 from astropy.io import fits
 
@@ -16,17 +18,33 @@ from pyobs_sbig.sbigudrv import *
 log = logging.getLogger(__name__)
 
 
+class Window(NamedTuple):
+    """Readout window in unbinned coordinates."""
+    left: int
+    top: int
+    width: int
+    height: int
+
+
+class Binning(NamedTuple):
+    """Binning factors for both axes."""
+    x: int
+    y: int
+
+
 class SbigBaseCamera(BaseCamera, ICamera, ICameraWindow):
     """A pyobs module for SBIG cameras."""
     __module__ = 'pyobs_sbig'
 
     def __init__(self, sensor: Union[str, ActiveSensor] = ActiveSensor.IMAGING, driver: SbigDriver = None,
-                 *args, **kwargs):
+                 affinity: int = None, compute_stats: bool = True, *args, **kwargs):
         """Initializes a new SbigCamera.
 
         Args:
             sensor: Sensor to use, if camera has more than one.
             driver: Driver to use, if any.
+            affinity: CPU core to pin the image finalizer thread to, if any.
+            compute_stats: Whether to add DATAMIN/DATAMAX/DATAMEAN to the FITS headers.
 
         """
         BaseCamera.__init__(self, *args, **kwargs)
@@ -51,7 +69,18 @@ class SbigBaseCamera(BaseCamera, ICamera, ICameraWindow):
         # window and binning
         self._full_frame = None
         self._window = None
-        self._binning = (1, 1)
+        self._binning = Binning(1, 1)
+
+        # finalizer thread that builds HDUs from acquired images
+        self._finalize_queue = queue.Queue(maxsize=2)
+        self._result_queue = queue.Queue()
+        self._finalize_thread = None
+
+        # cpu core for the finalizer thread, fail early on non-numeric config values
+        self._affinity = None if affinity is None else int(affinity)
+
+        # image statistics
+        self._compute_stats = compute_stats
 
     def open(self):
         """Open module.
@@ -62,7 +91,18 @@ class SbigBaseCamera(BaseCamera, ICamera, ICameraWindow):
         BaseCamera.open(self)
 
         # get window
-        self._window = self.get_full_frame()
+        self._window = Window(*self.get_full_frame())
+
+        # start finalizer thread
+        self._finalize_thread = threading.Thread(target=self._finalize_loop, daemon=True)
+        self._finalize_thread.start()
+
+    def close(self):
+        """Close module."""
+        BaseCamera.close(self)
+
+        # stop finalizer thread
+        self._finalize_queue.put(None)
 
     def get_full_frame(self, *args, **kwargs) -> Tuple[int, int, int, int]:
         """Returns full size of CCD.
@@ -70,7 +110,11 @@ class SbigBaseCamera(BaseCamera, ICamera, ICameraWindow):
         Returns:
             Tuple with left, top, width, and height set.
         """
-        return self._driver.full_frame(self._active_sensor)
+
+        # chip geometry never changes, so only query the camera once
+        if self._full_frame is None:
+            self._full_frame = self._driver.full_frame(self._active_sensor)
+        return self._full_frame
 
     def get_window(self, *args, **kwargs) -> Tuple[int, int, int, int]:
         """Returns the camera window.
@@ -89,7 +133,7 @@ class SbigBaseCamera(BaseCamera, ICamera, ICameraWindow):
             width: Width of window.
             height: Height of window.
         """
-        self._window = (left, top, width, height)
+        self._window = Window(left, top, width, height)
         log.info('Setting window to %dx%d at %d,%d...', width, height, left, top)
 
     def _expose(self, exposure_time: int, open_shutter: bool, abort_event: threading.Event) -> fits.PrimaryHDU:
@@ -107,24 +151,62 @@ class SbigBaseCamera(BaseCamera, ICamera, ICameraWindow):
             ValueError: If exposure was not successful.
         """
 
+        # acquire image from camera
+        item = self._acquire(exposure_time, open_shutter, abort_event)
+        if item is None:
+            return None
+
+        # hand it to the finalizer thread and wait for the finished HDU,
+        # checking that the finalizer is still there instead of hanging forever
+        self._finalize_queue.put(item)
+        while True:
+            try:
+                hdu = self._result_queue.get(timeout=10)
+                break
+            except queue.Empty:
+                if not self._finalize_thread.is_alive():
+                    raise ValueError('Finalizer thread died unexpectedly.')
+        if isinstance(hdu, Exception):
+            raise hdu
+
+        # return FITS image
+        log.info('Readout finished.')
+        self._change_exposure_status(ExposureStatus.IDLE)
+        return hdu
+
+    def _acquire(self, exposure_time: int, open_shutter: bool, abort_event: threading.Event) -> tuple:
+        """Drive the camera for a single exposure, including readout.
+
+        Args:
+            exposure_time: The requested exposure time in ms.
+            open_shutter: Whether or not to open the shutter.
+            abort_event: Event that gets triggered when exposure should be aborted.
+
+        Returns:
+            Tuple with image data, DATE-OBS, exposure time, temperature, and setpoint, or None if aborted.
+
+        Raises:
+            ValueError: If exposure was not successful.
+        """
+
         #  binning
         binning = self._binning
 
         # set window, CSBIGCam expects left/top also in binned coordinates, so divide by binning
-        left = int(math.floor(self._window[0]) / binning[0])
-        top = int(math.floor(self._window[1]) / binning[1])
-        width = int(math.floor(self._window[2]) / binning[0])
-        height = int(math.floor(self._window[3]) / binning[1])
+        left = int(math.floor(self._window.left) / binning.x)
+        top = int(math.floor(self._window.top) / binning.y)
+        width = int(math.floor(self._window.width) / binning.x)
+        height = int(math.floor(self._window.height) / binning.y)
         log.info("Set window to %dx%d (binned %dx%d) at %d,%d.",
-                 self._window[2], self._window[3], width, height, left, top)
+                 self._window.width, self._window.height, width, height, left, top)
         window = (left, top, width, height)
 
         # set exposing
         self._change_exposure_status(ExposureStatus.EXPOSING)
 
-        # get date obs
+        # get date obs, formatting is deferred to the finalizer
         log.info('Starting exposure with for %.2f seconds...', exposure_time)
-        date_obs = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
+        date_obs = datetime.utcnow()
 
         # init image
         self._img.image_can_close = False
@@ -152,39 +234,85 @@ class SbigBaseCamera(BaseCamera, ICamera, ICameraWindow):
         # finalize image
         self._img.image_can_close = True
 
-        # download data
-        data = self._img.data
+        # download data; copy it into a fresh array, since the HDU built from
+        # it escapes to the caller while the driver re-uses its image buffer
+        data = self._img.data.copy()
 
         # temp & cooling
         _, temp, setpoint, _ = self._driver.camera.get_cooling()
 
-        # create FITS image and set header
-        hdu = fits.PrimaryHDU(data)
-        hdu.header['DATE-OBS'] = (date_obs, 'Date and time of start of exposure')
-        hdu.header['EXPTIME'] = (exposure_time, 'Exposure time [s]')
-        hdu.header['DET-TEMP'] = (temp, 'CCD temperature [C]')
-        hdu.header['DET-TSET'] = (setpoint, 'Cooler setpoint [C]')
+        # hand over to finalizer
+        return data, date_obs, exposure_time, temp, setpoint
 
-        # binning
-        hdu.header['XBINNING'] = hdu.header['DET-BIN1'] = (self._binning[0], 'Binning factor used on X axis')
-        hdu.header['YBINNING'] = hdu.header['DET-BIN2'] = (self._binning[1], 'Binning factor used on Y axis')
+    def _finalize_loop(self):
+        """Processes acquired images in the background until module is closed."""
 
-        # window
-        hdu.header['XORGSUBF'] = (self._window[0], 'Subframe origin on X axis')
-        hdu.header['YORGSUBF'] = (self._window[1], 'Subframe origin on Y axis')
+        # pin thread to the configured core to avoid migration jitter; never
+        # let this kill the loop, it is the only consumer keeping _expose alive
+        if self._affinity is not None and hasattr(os, 'sched_setaffinity'):
+            try:
+                os.sched_setaffinity(0, {self._affinity})
+            except Exception as e:
+                log.warning('Could not pin finalizer thread to core %s: %s', self._affinity, str(e))
 
-        # statistics
-        hdu.header['DATAMIN'] = (float(np.min(data)), 'Minimum data value')
-        hdu.header['DATAMAX'] = (float(np.max(data)), 'Maximum data value')
-        hdu.header['DATAMEAN'] = (float(np.mean(data)), 'Mean data value')
+        while True:
+            # get next image, None signals shutdown
+            item = self._finalize_queue.get()
+            if item is None:
+                break
 
-        # biassec/trimsec
-        frame = self.get_full_frame()
-        self.set_biassec_trimsec(hdu.header, *frame)
+            # build HDU and hand it back, including any exception raised on the way
+            try:
+                self._result_queue.put(self._finalize(item))
+            except Exception as e:
+                self._result_queue.put(e)
 
-        # return FITS image
-        log.info('Readout finished.')
-        self._change_exposure_status(ExposureStatus.IDLE)
+    def _finalize(self, item: tuple) -> fits.PrimaryHDU:
+        """Build a FITS image from an acquired exposure.
+
+        Args:
+            item: Tuple with image data, DATE-OBS, exposure time, temperature, and setpoint.
+
+        Returns:
+            The actual image.
+        """
+
+        # unpack item
+        data, date_obs, exposure_time, temp, setpoint = item
+
+        # create FITS image and collect all header cards for a single batch
+        # update; store the uint16 data as-is, so astropy doesn't rescale and
+        # copy the array
+        hdu = fits.PrimaryHDU(data, do_not_scale_image_data=True, uint=True)
+        headers = {
+            'DATE-OBS': (date_obs.strftime("%Y-%m-%dT%H:%M:%S.%f"), 'Date and time of start of exposure'),
+            'EXPTIME': (exposure_time, 'Exposure time [s]'),
+            'DET-TEMP': (temp, 'CCD temperature [C]'),
+            'DET-TSET': (setpoint, 'Cooler setpoint [C]'),
+            # binning
+            'XBINNING': (self._binning.x, 'Binning factor used on X axis'),
+            'DET-BIN1': (self._binning.x, 'Binning factor used on X axis'),
+            'YBINNING': (self._binning.y, 'Binning factor used on Y axis'),
+            'DET-BIN2': (self._binning.y, 'Binning factor used on Y axis'),
+            # window
+            'XORGSUBF': (self._window.left, 'Subframe origin on X axis'),
+            'YORGSUBF': (self._window.top, 'Subframe origin on Y axis')
+        }
+
+        # statistics, all in a single pass over the image, but only if requested
+        if self._compute_stats:
+            datamin, datamax, datamean = minmaxmean(data)
+            headers['DATAMIN'] = (float(datamin), 'Minimum data value')
+            headers['DATAMAX'] = (float(datamax), 'Maximum data value')
+            headers['DATAMEAN'] = (float(datamean), 'Mean data value')
+
+        # set headers
+        hdu.header.update(headers)
+
+        # biassec/trimsec, using the cached full frame
+        self.set_biassec_trimsec(hdu.header, *self._full_frame)
+
+        # finished
         return hdu
 
     def _abort_exposure(self):
@@ -196,4 +324,4 @@ class SbigBaseCamera(BaseCamera, ICamera, ICameraWindow):
         self._change_exposure_status(ExposureStatus.IDLE)
 
 
-__all__ = ['SbigBaseCamera']
+__all__ = ['SbigBaseCamera', 'Window', 'Binning']
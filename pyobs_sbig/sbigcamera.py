@@ -1,7 +1,7 @@
 import logging
 
 from pyobs.interfaces import ICameraBinning, ICooling
-from .sbigbasecamera import SbigBaseCamera
+from .sbigbasecamera import SbigBaseCamera, Binning
 from .sbigudrv import *
 
 
@@ -22,6 +22,8 @@ class SbigCamera(SbigBaseCamera, ICameraBinning, ICooling):
 
         # cooling
         self._setpoint = setpoint
+        self._cooling = None
+        self._temps = {}
 
     def open(self):
         """Open module.
@@ -49,7 +51,7 @@ class SbigCamera(SbigBaseCamera, ICameraBinning, ICooling):
             x: X binning.
             y: Y binning.
         """
-        self._binning = (x, y)
+        self._binning = Binning(x, y)
         log.info('Setting binning to %dx%d...', x, y)
 
     def set_cooling(self, enabled: bool, setpoint: float, *args, **kwargs):
@@ -15,6 +15,9 @@ from .sbigudrv import *
 
 log = logging.getLogger(__name__)
 
+# wheel positions in order, enumerated once at import time
+_FILTER_WHEEL_POSITIONS = list(FilterWheelPosition)
+
 
 class SbigFilterCamera(MotionStatusMixin, SbigCamera, IFilters):
     """A pyobs module for SBIG cameras."""
@@ -31,10 +34,14 @@ class SbigFilterCamera(MotionStatusMixin, SbigCamera, IFilters):
         # and filter names
         if filter_names is None:
             filter_names = ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10']
-        positions = [p for p in FilterWheelPosition]
-        self._filter_names = dict(zip(positions[1:], filter_names))
+        self._filter_names = dict(zip(_FILTER_WHEEL_POSITIONS[1:], filter_names))
         self._filter_names[FilterWheelPosition.UNKNOWN] = 'UNKNOWN'
 
+        # reverse mapping from name to wheel position, built once
+        self._filter_positions = {name: pos for pos, name in self._filter_names.items()}
+        if len(self._filter_positions) != len(self._filter_names):
+            raise ValueError('Duplicate filter names.')
+
         # allow to abort motion (filter wheel)
         self._lock_motion = threading.Lock()
         self._abort_motion = threading.Event()
@@ -103,14 +110,14 @@ class SbigFilterCamera(MotionStatusMixin, SbigCamera, IFilters):
         if self._driver.filter_wheel == FilterWheelModel.UNKNOWN:
             raise NotImplementedError
 
-        # reverse dict and search for name
-        filters = {y: x for x, y in self._filter_names.items()}
-        if filter_name not in filters:
+        # search for name
+        if filter_name not in self._filter_positions:
             raise ValueError('Unknown filter: %s' % filter_name)
+        filter_pos = self._filter_positions[filter_name]
 
         # there already?
         position, status = self._driver.camera.get_filter_position_and_status()
-        if position == filters[filter_name] and status == FilterWheelStatus.IDLE:
+        if position == filter_pos and status == FilterWheelStatus.IDLE:
             log.info('Filter changed.')
             return
 
@@ -121,13 +128,13 @@ class SbigFilterCamera(MotionStatusMixin, SbigCamera, IFilters):
         with LockWithAbort(self._lock_motion, self._abort_motion):
             # set it
             log.info('Changing filter to %s...', filter_name)
-            self._driver.camera.set_filter(filters[filter_name])
+            self._driver.camera.set_filter(filter_pos)
 
             # wait for it
             while True:
                 # break, if wheel is idle and filter is set
                 position, status = self._driver.camera.get_filter_position_and_status()
-                if position == filters[filter_name] and status == FilterWheelStatus.IDLE:
+                if position == filter_pos and status == FilterWheelStatus.IDLE:
                     break
 
                 # abort?
@@ -114,7 +114,8 @@ cdef extern from "../src/csbigcam.h":
     cdef enum SBIG_DEVICE_TYPE:
         DEV_USB = 0x7F00
 
-    ctypedef int PAR_ERROR
+    ctypedef enum PAR_ERROR:
+        CE_NO_ERROR
 
     ctypedef enum SBIG_DARK_FRAME:
         SBDF_LIGHT_ONLY, SBDF_DARK_ONLY, SBDF_DARK_ALSO
@@ -185,9 +186,9 @@ cdef extern from "../src/csbigcam.h":
         PAR_ERROR Readout  (CSBIGImg *pImg, SBIG_DARK_FRAME dark) nogil
 
         # Low-Level Exposure Related Commands
-        PAR_ERROR StartExposure(SHUTTER_COMMAND shutterState)
-        PAR_ERROR EndExposure()
-        PAR_ERROR IsExposureComplete(MY_LOGICAL &complete)
+        PAR_ERROR StartExposure(SHUTTER_COMMAND shutterState) nogil
+        PAR_ERROR EndExposure() nogil
+        PAR_ERROR IsExposureComplete(MY_LOGICAL &complete) nogil
         #PAR_ERROR StartReadout(StartReadoutParams srp)
         PAR_ERROR EndReadout()
         #PAR_ERROR ReadoutLine(ReadoutLineParams rlp, MY_LOGICAL darkSubtract, unsigned short *dest)
@@ -1,4 +1,5 @@
 # distutils: language = c++
+# cython: boundscheck=False, wraparound=False, initializedcheck=False, cdivision=True
 import threading
 import time
 from enum import Enum
@@ -7,6 +8,8 @@ from typing import Tuple
 
 import numpy as np
 cimport numpy as np
+from cpython.ref cimport Py_INCREF
+from cython.parallel cimport prange
 np.import_array()
 
 from .sbigudrv cimport *
@@ -100,12 +103,71 @@ cdef class SBIGImg:
 
         # Use the PyArray_SimpleNewFromData function from numpy to create a
         # new Python object pointing to the existing data
-        arr = np.PyArray_SimpleNewFromData(1, shape, np.NPY_USHORT, <void *>self.obj.GetImagePointer())
+        cdef np.ndarray arr = np.PyArray_SimpleNewFromData(1, shape, np.NPY_USHORT,
+                                                           <void *>self.obj.GetImagePointer())
+
+        # the array is just a view into the image buffer, so make it keep this
+        # image alive (PyArray_SetBaseObject steals a reference)
+        Py_INCREF(self)
+        np.PyArray_SetBaseObject(arr, self)
 
         # reshape it to 2D
         return arr.reshape(height, width)
 
 
+def minmaxmean(unsigned short[:, ::1] data):
+    """Calculate minimum, maximum, and mean of an image in a single pass.
+
+    Args:
+        data: Image to calculate statistics for.
+
+    Returns:
+        Tuple with minimum, maximum, and mean.
+    """
+
+    # define vars
+    cdef Py_ssize_t x, y
+    cdef Py_ssize_t height = data.shape[0]
+    cdef Py_ssize_t width = data.shape[1]
+    cdef unsigned short mini = 65535
+    cdef unsigned short maxi = 0
+    cdef unsigned long long total = 0
+    cdef unsigned short value, row_min, row_max
+    cdef unsigned long long row_sum
+
+    # per-row partial stats, reduced serially below
+    cdef unsigned short[::1] row_mins = np.empty(height, dtype=np.uint16)
+    cdef unsigned short[::1] row_maxs = np.empty(height, dtype=np.uint16)
+    cdef unsigned long long[::1] row_sums = np.empty(height, dtype=np.uint64)
+
+    # reduce rows in parallel, each row still a single streaming pass
+    for y in prange(height, nogil=True, schedule='static'):
+        row_min = 65535
+        row_max = 0
+        row_sum = 0
+        for x in range(width):
+            value = data[y, x]
+            if value < row_min:
+                row_min = value
+            if value > row_max:
+                row_max = value
+            row_sum = row_sum + value
+        row_mins[y] = row_min
+        row_maxs[y] = row_max
+        row_sums[y] = row_sum
+
+    # combine per-row results
+    for y in range(height):
+        if row_mins[y] < mini:
+            mini = row_mins[y]
+        if row_maxs[y] > maxi:
+            maxi = row_maxs[y]
+        total += row_sums[y]
+
+    # return stats
+    return mini, maxi, total / float(height * width)
+
+
 cdef class SBIGCam:
     cdef CSBIGCam* obj
     cdef object aborted
@@ -254,9 +316,26 @@ cdef class SBIGCam:
     def was_aborted(self):
         return self.aborted
 
+    @staticmethod
+    cdef PAR_ERROR _start_exposure(CSBIGCam *cam, SHUTTER_COMMAND shutter_cmd) nogil:
+        cdef PAR_ERROR res = cam.StartExposure(shutter_cmd)
+        return res
+
+    @staticmethod
+    cdef PAR_ERROR _end_exposure(CSBIGCam *cam) nogil:
+        cdef PAR_ERROR res = cam.EndExposure()
+        return res
+
+    @staticmethod
+    cdef PAR_ERROR _is_exposure_complete(CSBIGCam *cam, MY_LOGICAL *complete) nogil:
+        cdef PAR_ERROR res = cam.IsExposureComplete(complete[0])
+        return res
+
     def start_exposure(self, img: SBIGImg, shutter: bool):
          # define vars
         cdef MY_LOGICAL complete = 0
+        cdef SHUTTER_COMMAND shutter_cmd
+        cdef PAR_ERROR res = CE_NO_ERROR
 
         # acquire lock
         with acquire_lock(self.lock):
@@ -271,25 +350,29 @@ cdef class SBIGCam:
             if res != 0:
                 raise ValueError(self.obj.GetErrorString(res))
 
-            # end current exposure, if any
-            res = self.obj.EndExposure()
+            # end current exposure, if any, without holding the GIL
+            with nogil:
+                res = SBIGCam._end_exposure(self.obj)
             if res != 0:
                 raise ValueError(self.obj.GetErrorString(res))
 
-            # start exposure
+            # start exposure, again without the GIL
             shutter_cmd = SHUTTER_COMMAND.SC_OPEN_SHUTTER if shutter else  SHUTTER_COMMAND.SC_CLOSE_SHUTTER
-            res = self.obj.StartExposure(shutter_cmd)
+            with nogil:
+                res = SBIGCam._start_exposure(self.obj, shutter_cmd)
             if res != 0:
                 raise ValueError('Could not start exposure: ' + self.obj.GetErrorString(res))
 
     def has_exposure_finished(self):
          # define vars
         cdef MY_LOGICAL complete = 0
+        cdef PAR_ERROR res = CE_NO_ERROR
 
         # acquire lock
         with acquire_lock(self.lock):
-            # is complete?
-            res = self.obj.IsExposureComplete(complete)
+            # is complete? release GIL while driver talks to the camera
+            with nogil:
+                res = SBIGCam._is_exposure_complete(self.obj, &complete)
             if res != 0:
                 raise ValueError('Could not get exposure status: ' + self.obj.GetErrorString(res))
 
@@ -297,29 +380,33 @@ cdef class SBIGCam:
             return res != 0 or complete
 
     def end_exposure(self):
+        # define vars
+        cdef PAR_ERROR res = CE_NO_ERROR
+
         # acquire lock
         with acquire_lock(self.lock):
-            res = self.obj.EndExposure()
+            with nogil:
+                res = SBIGCam._end_exposure(self.obj)
             if res != 0:
                 raise ValueError('Could not end exposure: ' + self.obj.GetErrorString(res))
 
     @staticmethod
-    cdef int _readout(CSBIGCam *cam, CSBIGImg *img, SBIG_DARK_FRAME mode) nogil:
-        cdef int res = cam.Readout(img, mode)
+    cdef PAR_ERROR _readout(CSBIGCam *cam, CSBIGImg *img, SBIG_DARK_FRAME mode) nogil:
+        cdef PAR_ERROR res = cam.Readout(img, mode)
         return res
 
     def readout(self, img: SBIGImg, shutter: bool):
         # get mode
         cdef SBIG_DARK_FRAME mode = SBIG_DARK_FRAME.SBDF_LIGHT_ONLY if shutter else SBIG_DARK_FRAME.SBDF_DARK_ONLY
-        cdef int res = 0
+        cdef PAR_ERROR res = CE_NO_ERROR
 
         # acquire lock
         with acquire_lock(self.lock):
             # do readout
             with nogil:
-                res = int(SBIGCam._readout(self.obj, img.obj, mode))
+                res = SBIGCam._readout(self.obj, img.obj, mode)
             if res != 0:
-                raise ValueError(self.obj.GetErrorString(int(res)))
+                raise ValueError(self.obj.GetErrorString(res))
 
     def set_filter_wheel(self, wheel: FilterWheelModel, com_port: FilterWheelComPort = FilterWheelComPort.COM1):
         # acquire lock
@@ -8,7 +8,8 @@ extensions = [
         ['pyobs_sbig/sbigudrv.pyx', 'src/csbigcam.cpp', 'src/csbigimg.cpp'],
         libraries=['sbigudrv', 'cfitsio'],
         include_dirs=[numpy.get_include(), '/usr/include/cfitsio'],
-        extra_compile_args=['-fPIC']
+        extra_compile_args=['-fPIC', '-O3', '-march=native', '-fopenmp'],
+        extra_link_args=['-fopenmp']
     )
 ]
 